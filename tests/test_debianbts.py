@@ -1,10 +1,14 @@
 """Tests for the debianbts module."""
 
 
+from __future__ import annotations
+
+import asyncio
 import datetime
 import email.message
+import functools
 import logging
-import math
+import os
 import unittest.mock as mock
 from typing import Any, Callable
 
@@ -29,31 +33,54 @@ def create_bugreport() -> Callable[..., Bugreport]:
     return factory
 
 
+@pytest.fixture(scope="session")
+def usertags() -> dict[str, list[int]]:
+    """All usertags of debian-python, fetched once per session."""
+    return bts.get_usertag("debian-python@lists.debian.org")
+
+
+@functools.cache
+def cached_get_status(nr: int) -> list[Bugreport]:
+    """Call get_status, fetching each bug only once per session."""
+    return bts.get_status(nr)
+
+
+@functools.cache
+def cached_get_bug_log(
+    nr: int,
+) -> list[dict[str, str | list[Any] | int | email.message.Message]]:
+    """Call get_bug_log, fetching each log only once per session."""
+    return bts.get_bug_log(nr)
+
+
+@pytest.mark.network
 def test_get_usertag_empty() -> None:
     """get_usertag should return empty dict if no bugs are found."""
     d = bts.get_usertag("thisisatest@debian.org")
     assert d == dict()
 
 
-def test_get_usertag() -> None:
+@pytest.mark.network
+def test_get_usertag(usertags: dict[str, list[int]]) -> None:
     """get_usertag should return dict with tag(s) and buglist(s)."""
-    d = bts.get_usertag("debian-python@lists.debian.org")
-    assert isinstance(d, dict)
-    for k, v in d.items():
+    assert isinstance(usertags, dict)
+    for k, v in usertags.items():
         assert isinstance(k, str)
         assert isinstance(v, list)
         for bug in v:
             assert isinstance(bug, int)
 
 
-def test_get_usertag_args(caplog: LogCaptureFixture) -> None:
+@pytest.mark.network
+def test_get_usertag_args(
+    caplog: LogCaptureFixture, usertags: dict[str, list[int]]
+) -> None:
     """Test get_usertags."""
     # no tags
-    tags = bts.get_usertag("debian-python@lists.debian.org")
-    assert len(tags) > 2
+    assert len(usertags) > 2
 
-    randomKey0 = list(tags.keys())[0]
-    randomKey1 = list(tags.keys())[1]
+    randomKey0 = list(usertags.keys())[0]
+    randomKey1 = list(usertags.keys())[1]
 
     # one tags
     tags = bts.get_usertag("debian-python@lists.debian.org", [randomKey0])
@@ -66,12 +93,14 @@ def test_get_usertag_args(caplog: LogCaptureFixture) -> None:
     assert len(tags) == 2
 
 
+@pytest.mark.network
 def test_get_bugs_empty(caplog: LogCaptureFixture) -> None:
     """get_bugs should return empty list if no matching bugs where found."""
     bugs = bts.get_bugs(package="thisisatest")
     assert bugs == []
 
 
+@pytest.mark.network
 def test_get_bugs(caplog: LogCaptureFixture) -> None:
     """get_bugs should return list of bugnumbers."""
     bugs = bts.get_bugs(submitter="venthur@debian.org")
@@ -81,6 +110,7 @@ def test_get_bugs(caplog: LogCaptureFixture) -> None:
         assert isinstance(i, int)
 
 
+@pytest.mark.network
 def test_newest_bugs() -> None:
     """newest_bugs should return list of bugnumbers."""
     bugs = bts.newest_bugs(10)
@@ -89,13 +119,15 @@ def test_newest_bugs() -> None:
         assert isinstance(i, int)
 
 
-def test_newest_bugs_amount() -> None:
+@pytest.mark.network
+@pytest.mark.parametrize("amount", [0, 1, 10])
+def test_newest_bugs_amount(amount: int) -> None:
     """newest_bugs(amount) should return a list of len 'amount'."""
-    for i in 0, 1, 10:
-        bugs = bts.newest_bugs(i)
-        assert len(bugs) == i
+    bugs = bts.newest_bugs(amount)
+    assert len(bugs) == amount
 
 
+@pytest.mark.network
 def test_get_bug_log() -> None:
     """get_bug_log should return the correct data types."""
     bl = bts.get_bug_log(223344)
@@ -112,6 +144,7 @@ def test_get_bug_log() -> None:
         assert isinstance(i["msg_num"], int)
 
 
+@pytest.mark.network
 def test_get_bug_log_with_attachments() -> None:
     """get_bug_log should include attachments."""
     buglogs = bts.get_bug_log(400000)
@@ -119,9 +152,10 @@ def test_get_bug_log_with_attachments() -> None:
         assert "attachments" in bl
 
 
+@pytest.mark.network
 def test_bug_log_message() -> None:
     """Dict returned by get_bug_log has a email.Message field."""
-    buglogs = bts.get_bug_log(400012)
+    buglogs = cached_get_bug_log(400012)
     for buglog in buglogs:
         assert "message" in buglog
         msg = buglog["message"]
@@ -131,9 +165,10 @@ def test_bug_log_message() -> None:
             assert isinstance(msg.get_payload(), str)
 
 
+@pytest.mark.network
 def test_bug_log_message_unicode() -> None:
     """Test parsing of bug_log mail with non ascii characters."""
-    buglogs = bts.get_bug_log(773321)
+    buglogs = cached_get_bug_log(773321)
     buglog = buglogs[2]
     msg = buglog["message"]
     assert isinstance(msg, email.message.Message)
@@ -142,6 +177,44 @@ def test_bug_log_message_unicode() -> None:
     assert "é" in msg_payload
 
 
+@mock.patch.object(bts.debianbts, "_soap_client_call")
+def test_get_bug_log_parses_message(mock_client: Any) -> None:
+    """get_bug_log should parse header and body into one message."""
+    mock_client.return_value = [
+        {
+            "header": (
+                "From: Foo <foo@example.com>\n"
+                "Subject: Bär\n"
+                "Content-Type: text/plain; charset=utf-8"
+            ),
+            "body": "Hällo\n",
+            "msg_num": "5",
+            "attachments": [],
+        },
+    ]
+    [buglog] = bts.get_bug_log(12345)
+    assert buglog["msg_num"] == 5
+    assert buglog["body"] == "Hällo\n"
+    msg = buglog["message"]
+    assert isinstance(msg, email.message.Message)
+    assert msg["Subject"] == "Bär"
+    assert msg.get_payload() == "Hällo\n"
+
+
+@mock.patch.object(bts.debianbts, "_get_status_batch")
+def test_aget_status(mock_batch: Any) -> None:
+    """aget_status calls can be awaited concurrently."""
+    mock_batch.side_effect = lambda numbers: numbers
+
+    async def main() -> tuple[list[Bugreport], list[Bugreport]]:
+        return await asyncio.gather(
+            bts.aget_status(1), bts.aget_status([2, 3])
+        )
+
+    assert list(asyncio.run(main())) == [[1], [2, 3]]
+
+
+@pytest.mark.network
 def test_empty_get_status() -> None:
     """get_status should return empty list if bug doesn't exits."""
     bugs = bts.get_status(0)
@@ -149,27 +222,28 @@ def test_empty_get_status() -> None:
     assert len(bugs) == 0
 
 
-def test_get_status_params(caplog: LogCaptureFixture) -> None:
+@pytest.mark.network
+@pytest.mark.parametrize(
+    "nrs, expected",
+    [
+        (223344, 1),
+        ([223344, 334455], 2),
+        ((223344, 334455), 2),
+    ],
+)
+def test_get_status_params(
+    nrs: int | list[int] | tuple[int, ...], expected: int
+) -> None:
     """Test get_status parameters."""
-    BUG = 223344
-    BUG2 = 334455
-
-    bugs = bts.get_status(BUG)
+    bugs = bts.get_status(nrs)
     assert isinstance(bugs, list)
-    assert len(bugs) == 1
-
-    bugs = bts.get_status([BUG, BUG2])
-    assert isinstance(bugs, list)
-    assert len(bugs) == 2
-
-    bugs = bts.get_status((BUG, BUG2))
-    assert isinstance(bugs, list)
-    assert len(bugs) == 2
+    assert len(bugs) == expected
 
 
+@pytest.mark.network
 def test_sample_get_status() -> None:
     """Test retrieving of a "known" bug status."""
-    bugs = bts.get_status(486212)
+    bugs = cached_get_status(486212)
     assert len(bugs) == 1
     bug = bugs[0]
     assert bug.bug_num == 486212
@@ -193,10 +267,61 @@ def test_sample_get_status() -> None:
     assert bug.affects == []
 
 
+# A bug status as decoded from the SOAP response
+STATUS_SAMPLE = {
+    "originator": "Bastian Venthur <venthur@debian.org>",
+    "date": "1213439402",
+    "subject": "[reportbug-ng] segmentation fault",
+    "msgid": "<20080614102802.GA1234@debian.org>",
+    "package": "reportbug-ng",
+    "tags": "help moreinfo",
+    "done": "Bastian Venthur <venthur@debian.org>",
+    "forwarded": "",
+    "mergedwith": "433550 474955",
+    "severity": "normal",
+    "owner": "",
+    "found_versions": ["reportbug-ng/0.2008.06.04"],
+    "fixed_versions": ["reportbug-ng/1.0"],
+    "blocks": "",
+    "blockedby": "123",
+    "unarchived": "",
+    "summary": "",
+    "affects": "epiphany-browser-dev, libwebkit-dev, ",
+    "log_modified": "1218957982",
+    "location": "archive",
+    "archived": "1",
+    "bug_num": "486212",
+    "source": "reportbug-ng",
+    "pending": "done",
+}
+
+
+def test_parse_status() -> None:
+    """_parse_status should convert the decoded SOAP values."""
+    bug = bts.debianbts._parse_status(STATUS_SAMPLE)
+    assert bug.bug_num == 486212
+    assert bug.date == datetime.datetime(2008, 6, 14, 10, 30, 2)
+    assert bug.log_modified == datetime.datetime(2008, 8, 17, 7, 26, 22)
+    assert bug.package == "reportbug-ng"
+    assert bug.severity == "normal"
+    assert bug.tags == ["help", "moreinfo"]
+    assert bug.mergedwith == [433550, 474955]
+    assert bug.blocks == []
+    assert bug.blockedby == [123]
+    assert bug.done
+    assert bug.done_by == "Bastian Venthur <venthur@debian.org>"
+    assert bug.archived
+    assert not bug.unarchived
+    assert bug.found_versions == ["reportbug-ng/0.2008.06.04"]
+    assert bug.fixed_versions == ["reportbug-ng/1.0"]
+    assert bug.affects == ["epiphany-browser-dev", "libwebkit-dev"]
+
+
+@pytest.mark.network
 def test_done_by_decoding() -> None:
     """Done by is properly base64 decoded when needed."""
     # no base64 encoding
-    bug = bts.get_status(486212)[0]
+    bug = cached_get_status(486212)[0]
     assert bug.done_by == "Bastian Venthur <venthur@debian.org>"
 
     # base64 encoding
@@ -208,13 +333,23 @@ def test_bug_str(
     create_bugreport: Callable[..., Bugreport],
 ) -> None:
     """Test string conversion of a Bugreport."""
-    b1 = create_bugreport(package="foo-pkg", bug_num=12222)
+    b1 = create_bugreport(package="foo-pkg", bug_num=12222, severity="minor")
     s = str(b1)
     assert isinstance(s, str)  # byte string in py2, unicode in py3
     assert "bug_num: 12222\n" in s
     assert "package: foo-pkg\n" in s
+    assert "severity: minor\n" in s
 
 
+def test_bug_slots() -> None:
+    """Bugreport only accepts its known attributes."""
+    bug = bts.Bugreport()
+    bug.package = "foo-pkg"
+    with pytest.raises(AttributeError):
+        bug.pakage = "foo-pkg"  # type: ignore[attr-defined]
+
+
+@pytest.mark.network
 def test_get_status_affects() -> None:
     """Test a bug with "affects" field."""
     bugs = bts.get_status([290501, 770490])
@@ -229,12 +364,32 @@ def test_status_batches_large_bug_counts(
 ) -> None:
     """get_status should perform requests in batches to reduce server load."""
     mock_client.return_value = {}
-    nr = bts.BATCH_SIZE + 10.0
-    calls = int(math.ceil(nr / bts.BATCH_SIZE))
-    bts.get_status([722226] * int(nr))
+    nr = bts.BATCH_SIZE + 10
+    calls = -(-nr // bts.BATCH_SIZE)
+    bts.get_status(list(range(nr)))
     assert mock_client.call_count == calls
 
 
+@mock.patch.object(bts.debianbts, "_soap_client_call")
+def test_empty_queries_are_not_sent(mock_client: Any) -> None:
+    """Queries that can't return anything don't contact the BTS."""
+    assert bts.newest_bugs(0) == []
+    assert bts.get_status([]) == []
+    assert list(bts.iter_status(())) == []
+    mock_client.assert_not_called()
+
+
+@mock.patch.object(bts.debianbts, "_soap_client_call")
+def test_status_deduplicates_bug_numbers(
+    mock_client: Any,
+) -> None:
+    """get_status should request each bug number only once."""
+    mock_client.return_value = {}
+    bts.get_status([3, 1, 3, 2, 1] * bts.BATCH_SIZE)
+    assert mock_client.call_count == 1
+    assert mock_client.call_args.args[1] == [3, 1, 2]
+
+
 @mock.patch.object(bts.debianbts, "_soap_client_call")
 def test_status_batches_multiple_arguments(
     mock_client: Any,
@@ -252,6 +407,140 @@ def test_status_batches_multiple_arguments(
     assert mock_client.call_count == calls
 
 
+@mock.patch.object(bts.debianbts, "_soap_client_call")
+def test_status_single_bug_is_not_wrapped(
+    mock_client: Any,
+) -> None:
+    """get_status should send a single bug number without an array."""
+    mock_client.return_value = {}
+    bts.get_status(486212)
+    mock_client.assert_called_once_with(
+        f"{{{bts.debianbts.NS}}}get_status", 486212
+    )
+    bts.get_status([486212, 433550])
+    mock_client.assert_called_with(
+        f"{{{bts.debianbts.NS}}}get_status", [486212, 433550]
+    )
+
+
+@mock.patch.object(bts.debianbts, "_get_status_batch")
+def test_status_batches_preserve_order(
+    mock_batch: Any,
+) -> None:
+    """get_status should return the bugs in the order of the batches."""
+    mock_batch.side_effect = lambda numbers: numbers
+    nrs = list(range(bts.BATCH_SIZE * 3 + 1))
+    assert bts.get_status(nrs) == nrs
+    assert mock_batch.call_count == 4
+
+
+@mock.patch.object(bts.debianbts, "_get_status_batch")
+def test_iter_status(
+    mock_batch: Any,
+) -> None:
+    """iter_status should yield the bugs batch by batch."""
+    mock_batch.side_effect = lambda numbers: numbers
+    nrs = list(range(bts.BATCH_SIZE * 3 + 1))
+    bugs = bts.iter_status(nrs)
+    assert mock_batch.call_count == 0
+    assert next(bugs) == 0
+    assert list(bugs) == nrs[1:]
+    assert mock_batch.call_count == 4
+    assert list(bts.iter_status(1)) == [1]
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+# Python 3.12+ warns about forking a process that runs threads
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+def test_state_after_fork() -> None:
+    """A forked child gets its own thread pool and connections."""
+    assert bts.debianbts._executor().submit(int).result() == 0
+    server = ("https", "bugs.debian.org")
+    conn = bts.debianbts._get_connection(*server)
+    pid = os.fork()
+    if pid == 0:
+        try:
+            future = bts.debianbts._executor().submit(int)
+            assert future.result(timeout=3) == 0
+            new_conn = bts.debianbts._get_connection(*server)
+            os._exit(0 if new_conn is not conn else 1)
+        except BaseException:
+            os._exit(1)
+    bts.debianbts._close_connection()
+    _, status = os.waitpid(pid, 0)
+    assert os.WIFEXITED(status)
+    assert os.WEXITSTATUS(status) == 0
+
+
+@mock.patch.object(bts.debianbts, "_soap_request")
+def test_cache(mock_request: Any) -> None:
+    """Repeated queries are answered from the cache when it is enabled."""
+    mock_request.return_value = ["1", "2"]
+    bts.enable_cache()
+    try:
+        assert bts.newest_bugs(2) == [1, 2]
+        assert bts.newest_bugs(2) == [1, 2]
+        assert mock_request.call_count == 1
+        bts.newest_bugs(3)
+        assert mock_request.call_count == 2
+    finally:
+        bts.disable_cache()
+    bts.newest_bugs(2)
+    assert mock_request.call_count == 3
+
+
+@mock.patch.object(bts.debianbts, "_soap_request")
+def test_clear_cache(mock_request: Any) -> None:
+    """Cleared responses are fetched again."""
+    mock_request.return_value = ["1"]
+    bts.clear_cache()
+    bts.enable_cache()
+    try:
+        bts.newest_bugs(1)
+        bts.clear_cache()
+        bts.newest_bugs(1)
+        bts.newest_bugs(1)
+        assert mock_request.call_count == 2
+    finally:
+        bts.disable_cache()
+
+
+@mock.patch.object(bts.debianbts, "_soap_request")
+def test_cache_expiry_and_eviction(mock_request: Any) -> None:
+    """Cached responses expire after ttl and are evicted after maxsize."""
+    mock_request.return_value = []
+    bts.enable_cache(ttl=0)
+    try:
+        bts.newest_bugs(1)
+        bts.newest_bugs(1)
+        assert mock_request.call_count == 2
+        bts.enable_cache(maxsize=1)
+        bts.newest_bugs(1)
+        bts.newest_bugs(2)
+        bts.newest_bugs(1)
+        assert mock_request.call_count == 5
+    finally:
+        bts.disable_cache()
+
+
+@mock.patch.object(bts.debianbts, "_soap_request")
+def test_cache_status_per_bug(mock_request: Any) -> None:
+    """get_status only requests the bugs that are not cached yet."""
+    mock_request.side_effect = lambda method, args: {
+        str(nr): dict(STATUS_SAMPLE, bug_num=str(nr))
+        for nr in (args[0] if isinstance(args[0], list) else [args[0]])
+    }
+    bts.enable_cache()
+    try:
+        bts.get_status([1, 2])
+        bugs = bts.get_status([3, 2, 1])
+        assert [bug.bug_num for bug in bugs] == [3, 2, 1]
+        assert mock_request.call_count == 2
+        assert mock_request.call_args.args[1] == (3,)
+    finally:
+        bts.disable_cache()
+
+
 def test_comparison(create_bugreport: Callable[..., Bugreport]) -> None:
     """Comparison of two bugs."""
     b1 = create_bugreport(severity="normal", archived=True)
@@ -275,12 +564,27 @@ def test_comparison_equal(create_bugreport: Callable[..., Bugreport]) -> None:
     assert b2 <= b1
 
 
+def test_comparison_after_change(
+    create_bugreport: Callable[..., Bugreport],
+) -> None:
+    """Changing a bug after a comparison must update the ordering."""
+    b1 = create_bugreport(severity="normal", archived=False, done=False)
+    b2 = create_bugreport(severity="minor", archived=False, done=False)
+    assert b1 > b2
+    b2.severity = "critical"
+    assert b1 < b2
+    b2.archived = True
+    assert b1 > b2
+
+
+@pytest.mark.network
 def test_get_bugs_int_bugs() -> None:
     """It is possible to pass a list of bug number to get_bugs."""
     bugs = bts.get_bugs(bugs=[400010, 400012], archive="1")
     assert set(bugs) == {400010, 400012}
 
 
+@pytest.mark.network
 def test_get_bugs_single_int_bug() -> None:
     """Bugs parameter in get_bugs can be a list of int or a int."""
     bugs1 = bts.get_bugs(bugs=400040, archive="1")
@@ -288,6 +592,7 @@ def test_get_bugs_single_int_bug() -> None:
     assert bugs1 == bugs2
 
 
+@pytest.mark.network
 def test_get_bugs_archived() -> None:
     """Archive tristate."""
     # the parameter is rather undocumented. with trial and error i found
@@ -299,6 +604,7 @@ def test_get_bugs_archived() -> None:
     assert len(bugs_both) == len(bugs_unarchived) + len(bugs_archived)
 
 
+@pytest.mark.network
 def test_get_bugs_archived_default() -> None:
     """Return un-archived bugs by default."""
     bugs_unarchived = bts.get_bugs(src="python-debianbgs", archive="0")
@@ -306,33 +612,39 @@ def test_get_bugs_archived_default() -> None:
     assert len(bugs_default) == len(bugs_unarchived)
 
 
-def test_mergedwith() -> None:
+@pytest.mark.network
+@pytest.mark.parametrize(
+    "nr, merged",
+    [
+        # this one is merged with two other bugs
+        (486212, 2),
+        # this one was merged with one bug
+        (433550, 1),
+        # this one was not merged
+        (474955, 0),
+    ],
+)
+def test_mergedwith(nr: int, merged: int) -> None:
     """Mergedwith is always a list of int."""
-    # this one is merged with two other bugs
-    m = bts.get_status(486212)[0].mergedwith
-    assert len(m) == 2
+    m = cached_get_status(nr)[0].mergedwith
+    assert len(m) == merged
     for i in m:
         assert isinstance(i, int)
-    # this one was merged with one bug
-    m = bts.get_status(433550)[0].mergedwith
-    assert len(m) == 1
-    assert isinstance(m[0], int)
-    # this one was not merged
-    m = bts.get_status(474955)[0].mergedwith
-    assert m == list()
 
 
+@pytest.mark.network
 def test_base64_status_fields() -> None:
     """Fields in bug status are sometimes base64-encoded."""
-    bug = bts.get_status(711111)[0]
+    bug = cached_get_status(711111)[0]
     assert isinstance(bug.originator, str)
     assert bug.originator.endswith("gmail.com>")
     assert "ł" in bug.originator
 
 
+@pytest.mark.network
 def test_base64_buglog_body() -> None:
     """Buglog body is sometimes base64 encoded."""
-    buglog = bts.get_bug_log(773321)
+    buglog = cached_get_bug_log(773321)
     body1 = buglog[1]["body"]
     body2 = buglog[2]["body"]
     assert isinstance(body1, str)
@@ -340,6 +652,7 @@ def test_base64_buglog_body() -> None:
     assert "é" in body2
 
 
+@pytest.mark.network
 def test_string_status_originator() -> None:
     """Test reading of bug status originator that is not base64-encoded."""
     bug = bts.get_status(711112)[0]
@@ -347,12 +660,15 @@ def test_string_status_originator() -> None:
     assert bug.originator.endswith("debian.org>")
 
 
+@pytest.mark.network
 def test_unicode_conversion_in_str() -> None:
     """String representation must deal with unicode correctly."""
-    [bug] = bts.get_status(773321)
+    [bug] = cached_get_status(773321)
     bug.__str__()
 
 
+@pytest.mark.network
+@pytest.mark.regression
 def test_regression_588954() -> None:
     """Get_bug_log must convert the body correctly to unicode."""
     bts.get_bug_log(582010)
@@ -363,6 +679,8 @@ def test_version() -> None:
     assert isinstance(bts.__version__, str)
 
 
+@pytest.mark.network
+@pytest.mark.regression
 def test_regression_590073() -> None:
     """bug.blocks is sometimes a str sometimes an int."""
     # test the int case
@@ -370,33 +688,43 @@ def test_regression_590073() -> None:
     bts.get_status(568657)
 
 
+@pytest.mark.network
+@pytest.mark.regression
 def test_regression_590725() -> None:
     """bug.body utf sometimes contains invalid continuation bytes."""
     bts.get_bug_log(578363)
     bts.get_bug_log(570825)
 
 
+@pytest.mark.network
+@pytest.mark.regression
 def test_regression_670446() -> None:
     """Affects should be split by ','."""
     bug = bts.get_status(657408)[0]
     assert bug.affects == ["epiphany-browser-dev", "libwebkit-dev"]
 
 
+@pytest.mark.network
+@pytest.mark.regression
 def test_regression_799528() -> None:
     """Fields of buglog are sometimes base64 encoded."""
     # bug with base64 encoding originator
-    [bug] = bts.get_status(711111)
+    [bug] = cached_get_status(711111)
     assert "ł" in bug.originator
     # bug with base64 encoding subject
     [bug] = bts.get_status(779005)
     assert "‘" in bug.subject
 
 
+@pytest.mark.network
+@pytest.mark.regression
 def test_regression_917165() -> None:
     """Test regression for 917165."""
     bts.get_bug_log(887978)
 
 
+@pytest.mark.network
+@pytest.mark.regression
 def test_regression_917258() -> None:
     """Test regression for 917258."""
     bts.get_bug_log(541147)
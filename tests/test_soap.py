@@ -1,15 +1,24 @@
 """Tests for SOAP calls."""
 
 
+import gzip
+import http.client
+import io
+import unittest.mock as mock
 import xml.etree.ElementTree as ET
+from typing import Any
 
 import pytest
 
 from debianbts.debianbts import (
+    _close_connection,
     _decode_soap_response,
-    _decode_value,
     _encode_soap_request,
     _encode_value,
+    _get_connection,
+    _get_proxy,
+    _post,
+    _proxy_headers,
 )
 
 
@@ -24,44 +33,72 @@ def test_encode_value() -> None:
 
     expected = """
         <root
-            xmlns:ns1="http://schemas.xmlsoap.org/soap/encoding/"
+            xmlns:soapenc="http://schemas.xmlsoap.org/soap/encoding/"
             xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
-            xmlns:xs="http://www.w3.org/2001/XMLSchema"
+            xmlns:xsd="http://www.w3.org/2001/XMLSchema"
         >
-            <value xsi:type="ns1:Array" ns1:arrayType="xs:anyType[8]">
-                <item xsi:type="xs:string">String</item>
-                <item xsi:type="xs:string">hello world</item>
-                <item xsi:type="xs:string">Integer</item>
-                <item xsi:type="xs:int">123</item>
-                <item xsi:type="xs:string">Boolean</item>
-                <item xsi:type="xs:int">1</item>
-                <item xsi:type="xs:string">List</item>
-                <item xsi:type="ns1:Array" ns1:arrayType="xs:anyType[2]">
-                    <item xsi:type="xs:string">a</item>
-                    <item xsi:type="xs:string">b</item>
+            <value xsi:type="soapenc:Array" soapenc:arrayType="xsd:anyType[8]">
+                <item xsi:type="xsd:string">String</item>
+                <item xsi:type="xsd:string">hello world</item>
+                <item xsi:type="xsd:string">Integer</item>
+                <item xsi:type="xsd:int">123</item>
+                <item xsi:type="xsd:string">Boolean</item>
+                <item xsi:type="xsd:int">1</item>
+                <item xsi:type="xsd:string">List</item>
+                <item
+                    xsi:type="soapenc:Array"
+                    soapenc:arrayType="xsd:anyType[2]"
+                >
+                    <item xsi:type="xsd:string">a</item>
+                    <item xsi:type="xsd:string">b</item>
                 </item>
             </value>
         </root>
     """
     expected = ET.canonicalize(expected, strip_text=True)
 
-    root = ET.Element("root")
-    _encode_value(root, "value", value)
-    actual = ET.canonicalize(ET.tostring(root))
+    parts = [
+        '<root xmlns:soapenc="http://schemas.xmlsoap.org/soap/encoding/" '
+        'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+        'xmlns:xsd="http://www.w3.org/2001/XMLSchema">'
+    ]
+    _encode_value(parts, "value", value)
+    parts.append("</root>")
+    actual = ET.canonicalize("".join(parts))
 
     assert actual == expected
 
 
+def test_encode_value_escapes_text() -> None:
+    """Test that markup in strings is escaped."""
+    parts: list[str] = []
+    _encode_value(parts, "value", "a < b & c")
+    assert parts == ['<value xsi:type="xsd:string">a &lt; b &amp; c</value>']
+
+
+def test_encode_value_int_list() -> None:
+    """Test that lists of integers encode like any other sequence."""
+    parts: list[str] = []
+    _encode_value(parts, "value", [1, 2])
+    expected: list[str] = []
+    _encode_value(expected, "value", (1, 2))
+    assert parts == expected
+    assert parts[1] == '<item xsi:type="xsd:int">1</item>'
+
+
 def test_decode_value() -> None:
     """Test that XML data is correctly decoded."""
-    xml = ET.fromstring(
-        """
-        <root
+    xml = b"""
+        <soap:Envelope
+            xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/"
+            xmlns:ns1="Debbugs/SOAP"
             xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
             xmlns:xs="http://www.w3.org/2001/XMLSchema"
             xmlns:soapenc="http://schemas.xmlsoap.org/soap/encoding/"
             xmlns:apachens="http://xml.apache.org/xml-soap"
         >
+          <soap:Body>
+            <ns1:someResponse>
             <value xsi:type="soapenc:Array" soapenc:arrayType="xs:anyType[6]">
                 <item xsi:type="xs:string">hello world</item>
                 <item xsi:type="xs:base64Binary">YmluYXJ5IGRhdGE=</item>
@@ -81,9 +118,10 @@ def test_decode_value() -> None:
                     <d xsi:type="xs:int">4</d>
                 </gensym>
             </value>
-        </root>
+            </ns1:someResponse>
+          </soap:Body>
+        </soap:Envelope>
         """
-    )
 
     expected = [
         "hello world",
@@ -93,26 +131,27 @@ def test_decode_value() -> None:
         {"c": "3", "d": "4"},
     ]
 
-    actual = _decode_value(xml[0])
+    actual = _decode_soap_response(xml)
     assert actual == expected
 
 
 def test_encode_soap_request() -> None:
     """Test that SOAP requests can be encoded."""
     expected = """
-        <ns0:Envelope
-            xmlns:ns0="http://schemas.xmlsoap.org/soap/envelope/"
-            xmlns:ns1="Debbugs/SOAP/V1"
+        <soap:Envelope
+            xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/"
+            xmlns:soapenc="http://schemas.xmlsoap.org/soap/encoding/"
+            xmlns:m="Debbugs/SOAP/V1"
             xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
-            xmlns:xs="http://www.w3.org/2001/XMLSchema"
-            ns0:encodingStyle="http://schemas.xmlsoap.org/soap/encoding/"
+            xmlns:xsd="http://www.w3.org/2001/XMLSchema"
+            soap:encodingStyle="http://schemas.xmlsoap.org/soap/encoding/"
         >
-            <ns0:Body>
-                <ns1:newest_bugs>
-                    <arg xsi:type="xs:int">123</arg>
-                </ns1:newest_bugs>
-            </ns0:Body>
-        </ns0:Envelope>
+            <soap:Body>
+                <m:newest_bugs>
+                    <arg xsi:type="xsd:int">123</arg>
+                </m:newest_bugs>
+            </soap:Body>
+        </soap:Envelope>
     """
     expected = ET.canonicalize(expected, strip_text=True)
     actual = ET.canonicalize(
@@ -121,6 +160,14 @@ def test_encode_soap_request() -> None:
     assert actual == expected
 
 
+def test_encode_soap_request_without_namespace() -> None:
+    """Test that method names without a namespace are encoded as is."""
+    request = ET.fromstring(_encode_soap_request("newest_bugs", [123]))
+    body = request.find("{http://schemas.xmlsoap.org/soap/envelope/}Body")
+    assert body is not None
+    assert [child.tag for child in body] == ["newest_bugs"]
+
+
 def test_decode_soap_response() -> None:
     """Test that SOAP responses can be decoded."""
     xml = b"""
@@ -138,6 +185,46 @@ def test_decode_soap_response() -> None:
          </soap:Envelope>
     """
     assert _decode_soap_response(xml) == "abc"
+    assert _decode_soap_response(io.BytesIO(xml)) == "abc"
+
+
+def test_decode_soap_response_nested() -> None:
+    """Test that only the first value of the first Body child is decoded."""
+    xml = b"""
+         <soap:Envelope
+            xmlns:ns1="Debbugs/SOAP"
+            xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/"
+            xmlns:soapenc="http://schemas.xmlsoap.org/soap/encoding/"
+            xmlns:apachens="http://xml.apache.org/xml-soap"
+            xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
+            xmlns:xs="http://www.w3.org/2001/XMLSchema"
+         >
+             <soap:Header>
+                 <ns1:something>
+                    <ignored xsi:type="xs:string">header</ignored>
+                 </ns1:something>
+             </soap:Header>
+             <soap:Body>
+                 <ns1:someResponse>
+                    <return xsi:type="apachens:Map">
+                        <item>
+                            <key xsi:type="xs:int">1</key>
+                            <value>
+                                <tags xsi:type="xs:string">a b</tags>
+                                <list xsi:type="soapenc:Array">
+                                    <item xsi:type="xs:int">2</item>
+                                </list>
+                            </value>
+                        </item>
+                    </return>
+                    <ignored xsi:type="xs:string">second</ignored>
+                 </ns1:someResponse>
+                 <ignored xsi:type="xs:string">third</ignored>
+             </soap:Body>
+         </soap:Envelope>
+    """
+    expected = {"1": {"tags": "a b", "list": ["2"]}}
+    assert _decode_soap_response(xml) == expected
 
 
 def test_decode_soap_fault_response() -> None:
@@ -160,3 +247,127 @@ def test_decode_soap_fault_response() -> None:
     with pytest.raises(RuntimeError) as excinfo:
         _decode_soap_response(xml)
     assert "Some error message" in str(excinfo.value)
+
+
+def test_decode_soap_fault_response_typed_faultcode() -> None:
+    """Test that the children of a SOAP fault are not decoded as values."""
+    xml = b"""
+         <soap:Envelope
+            xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/"
+            xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
+            xmlns:xsd="http://www.w3.org/2001/XMLSchema"
+         >
+             <soap:Body>
+                 <soap:Fault>
+                     <faultcode xsi:type="xsd:QName">soap:Server</faultcode>
+                     <faultstring>Bad thing</faultstring>
+                 </soap:Fault>
+             </soap:Body>
+         </soap:Envelope>
+    """
+    with pytest.raises(RuntimeError, match="SOAP fault: Bad thing"):
+        _decode_soap_response(xml)
+
+
+def test_get_connection_is_reused() -> None:
+    """Test that the connection is kept for the same server."""
+    conn = _get_connection("https", "bugs.debian.org")
+    assert _get_connection("https", "bugs.debian.org") is conn
+    other = _get_connection("http", "localhost:8080")
+    assert other is not conn
+    assert other.host == "localhost"
+    assert other.port == 8080
+    _close_connection()
+
+
+def test_get_connection_through_proxy() -> None:
+    """Test that HTTPS connections are tunneled through the proxy."""
+    conn = _get_connection(
+        "https", "bugs.debian.org", "http://user:pw@proxy:3128"
+    )
+    assert conn.host == "proxy"
+    assert conn.port == 3128
+    assert _get_connection("https", "bugs.debian.org") is not conn
+    _close_connection()
+
+
+def test_get_proxy_from_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the proxy environment variables are honoured."""
+    for name in ("HTTPS_PROXY", "NO_PROXY", "no_proxy"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("https_proxy", "http://proxy:3128")
+    assert _get_proxy("https://bugs.debian.org") == "http://proxy:3128"
+    # the proxy set with set_soap_proxy takes precedence
+    with mock.patch.dict(
+        "debianbts.debianbts._soap_client_kwargs",
+        {"proxy": "http://other:8080"},
+    ):
+        assert _get_proxy("https://bugs.debian.org") == "http://other:8080"
+    monkeypatch.setenv("no_proxy", "localhost,.debian.org")
+    assert _get_proxy("https://bugs.debian.org") is None
+    assert _get_proxy("https://example.org") == "http://proxy:3128"
+    monkeypatch.delenv("https_proxy")
+    assert _get_proxy("https://example.org") is None
+
+
+def test_proxy_headers() -> None:
+    """Test that proxy credentials are sent as basic auth."""
+    assert _proxy_headers("http://proxy:3128") == {}
+    assert _proxy_headers("proxy:3128") == {}
+    assert _proxy_headers("http://user%40x:pw@proxy:3128") == {
+        "Proxy-Authorization": "Basic dXNlckB4OnB3",
+    }
+
+
+class _FakeSocket:
+    """A socket that answers with a canned HTTP response."""
+
+    def __init__(self, data: bytes) -> None:
+        self._file = io.BytesIO(data)
+
+    def makefile(self, mode: str) -> io.BytesIO:
+        return self._file
+
+
+@mock.patch("debianbts.debianbts._get_connection")
+def test_post_decompresses_gzip(mock_connection: Any) -> None:
+    """Test that gzip compressed responses are decompressed."""
+    body = gzip.compress(b"<xml/>")
+    sock: Any = _FakeSocket(
+        b"HTTP/1.1 200 OK\r\n"
+        b"Content-Type: text/xml\r\n"
+        b"Content-Encoding: gzip\r\n"
+        b"Content-Length: %d\r\n\r\n%s" % (len(body), body)
+    )
+    response = http.client.HTTPResponse(sock)
+    response.begin()
+    conn = mock_connection.return_value
+    conn.getresponse.return_value = response
+
+    assert _post(b"").read() == b"<xml/>"
+    headers = conn.request.call_args.kwargs["headers"]
+    assert headers["Accept-Encoding"] == "gzip"
+    assert response.isclosed()
+
+
+@mock.patch("debianbts.debianbts._get_connection")
+def test_post_uses_environment_proxy(
+    mock_connection: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that requests go through the proxy from the environment."""
+    for name in ("HTTPS_PROXY", "NO_PROXY", "no_proxy"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("https_proxy", "http://proxy:3128")
+    sock: Any = _FakeSocket(
+        b"HTTP/1.1 200 OK\r\n"
+        b"Content-Type: text/xml\r\n"
+        b"Content-Length: 6\r\n\r\n<xml/>"
+    )
+    response = http.client.HTTPResponse(sock)
+    response.begin()
+    mock_connection.return_value.getresponse.return_value = response
+
+    assert _post(b"").read() == b"<xml/>"
+    mock_connection.assert_called_once_with(
+        "https", "bugs.debian.org", "http://proxy:3128"
+    )
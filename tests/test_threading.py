@@ -1,12 +1,13 @@
 """Test threading behaviour of debianbts."""
 
 
-import logging
-import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
 
 import debianbts as bts
 
-logger = logging.getLogger(__name__)
+pytestmark = pytest.mark.network
 
 
 class TestThreading:
@@ -14,33 +15,15 @@ class TestThreading:
 
     def test_multithreading(self) -> None:
         """Test multithreading."""
-        self._thread_failed = False
-        threads = [
-            threading.Thread(target=self._get_bugs_thread, args=(pkg,))
-            for pkg in ("python3-gst-1.0", "libsoxr0")
-        ] + [
-            threading.Thread(target=self._get_bug_log_thread, args=(bug_n,))
-            for bug_n in (300000, 300001)
-        ]
-
-        for thread in threads:
-            thread.start()
-
-        for thread in threads:
-            thread.join()
-
-        assert not self._thread_failed
-
-    def _get_bugs_thread(self, pkg: str) -> None:
-        try:
-            bts.get_bugs(package=pkg)
-        except Exception:
-            self._thread_failed = True
-            logger.exception("Threaded get_bugs() call failed.")
-
-    def _get_bug_log_thread(self, bug_num: int) -> None:
-        try:
-            bts.get_bug_log(bug_num)
-        except Exception:
-            self._thread_failed = True
-            logger.exception("Threaded get_bug_log() call failed.")
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(bts.get_bugs, package=pkg)
+                for pkg in ("python3-gst-1.0", "libsoxr0")
+            ] + [
+                executor.submit(bts.get_bug_log, bug_n)
+                for bug_n in (300000, 300001)
+            ]
+
+        # re-raises the exception of a failed call, with its traceback
+        for future in futures:
+            future.result()